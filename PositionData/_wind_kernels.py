@@ -0,0 +1,113 @@
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def true_wind_kernel(pv, pd_deg, rwv, rwd_deg, sensor_cw_rot, sensor_to_north, out_speed, out_dir, out_u, out_v):
+        """
+        Fused true-wind computation over contiguous float arrays.
+
+        One pass per row computes the platform and registered wind vectors,
+        subtracts them and writes speed and direction straight into the output
+        arrays, so no intermediate component arrays are allocated.
+
+        :param pv: Platform speeds.
+        :param pd_deg: Platform directions in degrees relative to north.
+        :param rwv: Registered wind velocities.
+        :param rwd_deg: Registered wind directions in degrees.
+        :param sensor_cw_rot: CW rotation of the sensor relative to platform noze.
+        :param sensor_to_north: If true, sensor readings are relative to North.
+        :param out_speed: Output array for true wind speed.
+        :param out_dir: Output array for true wind direction in degrees.
+        :param out_u: Output array for the east (sin) wind component.
+        :param out_v: Output array for the north (cos) wind component.
+        """
+        two_pi = 2.0 * math.pi
+        tolerance = -0.001
+        cw_rot = math.radians(sensor_cw_rot)
+        for i in prange(pv.shape[0]):
+            pd_rad = math.radians(pd_deg[i])
+            rwd_rad = math.radians(rwd_deg[i])
+            if not sensor_to_north:
+                rwd_rad = (pd_rad + rwd_rad + cw_rot) % two_pi
+            px = pv[i] * math.cos(pd_rad)
+            py = pv[i] * math.sin(pd_rad)
+            rwx = rwv[i] * math.cos(rwd_rad)
+            rwy = rwv[i] * math.sin(rwd_rad)
+            twx = rwx - px
+            twy = rwy - py
+            out_speed[i] = math.sqrt(twx * twx + twy * twy)
+            twd_degrees = math.degrees(math.atan2(twy, twx))
+            out_dir[i] = twd_degrees + 360.0 if twd_degrees < tolerance else twd_degrees
+            # twx points north and twy east, matching grid_wind's u = sin, v = cos
+            out_u[i] = twy
+            out_v[i] = twx
+
+
+def compute_true_wind(pv, pd_deg, rwv, rwd_deg, sensor_cw_rot=0, sensor_to_north=False):
+    """
+    Compute true wind from platform motion and relative wind readings.
+
+    Single home for the true-wind math: dispatches to the fused numba kernel
+    when available and otherwise runs the equivalent vectorized NumPy chain,
+    so every caller shares one implementation and one set of conventions.
+
+    :param pv: Platform speeds as a float64 array.
+    :param pd_deg: Platform directions in degrees relative to north.
+    :param rwv: Registered wind velocities.
+    :param rwd_deg: Registered wind directions in degrees.
+    :param sensor_cw_rot: CW rotation of the sensor relative to platform noze.
+    :param sensor_to_north: If true, sensor readings are relative to North.
+    :return: Tuple (speed, direction_deg, u, v) of float64 arrays; rows with
+        any invalid input are NaN throughout.
+    """
+    if NUMBA_AVAILABLE:
+        # Fused kernel writes speed, direction and components in one parallel pass
+        twv = np.empty_like(pv)
+        twd_degrees = np.empty_like(pv)
+        tw_u = np.empty_like(pv)
+        tw_v = np.empty_like(pv)
+        true_wind_kernel(pv, pd_deg, rwv, rwd_deg, float(sensor_cw_rot), sensor_to_north, twv, twd_degrees, tw_u, tw_v)
+
+        # fastmath leaves NaN handling undefined, so mask invalid rows explicitly
+        invalid = ~(np.isfinite(pv) & np.isfinite(pd_deg) & np.isfinite(rwv) & np.isfinite(rwd_deg))
+        twv[invalid] = np.nan
+        twd_degrees[invalid] = np.nan
+        tw_u[invalid] = np.nan
+        tw_v[invalid] = np.nan
+        return twv, twd_degrees, tw_u, tw_v
+
+    tolerance = -0.001
+    pd_rad = np.radians(pd_deg)
+    rwd_rad = np.radians(rwd_deg)
+
+    # if sensor readings are relative to platform body
+    # calculate angle relative to north
+    if not sensor_to_north:
+        rwd_rad = (pd_rad + rwd_rad + math.radians(sensor_cw_rot)) % (2 * math.pi)
+
+    # now calculate vector components
+    px = pv * np.cos(pd_rad)
+    py = pv * np.sin(pd_rad)
+    rwx = rwv * np.cos(rwd_rad)
+    rwy = rwv * np.sin(rwd_rad)
+    # calculate true wind vector
+    twx = rwx - px
+    twy = rwy - py
+
+    # calculate true wind speed and direction; hypot is one ufunc pass
+    # with no squared temporaries and is stable against over/underflow
+    twv = np.hypot(twx, twy)
+    twd_degrees = np.degrees(np.arctan2(twy, twx))
+    # arctan2 output is in [-180, 180], so a conditional in-place add
+    # replaces the usual (x + 360) % 360 and its per-element division
+    np.add(twd_degrees, 360.0, out=twd_degrees, where=twd_degrees < tolerance)
+    # twx points north and twy east, matching grid_wind's u = sin, v = cos
+    return twv, twd_degrees, twy, twx
@@ -1,8 +1,66 @@
 import numpy as np
 import rasterio
 from rasterio.transform import from_origin
-from rasterio import warp
-from scipy.interpolate import griddata
+from scipy.spatial import cKDTree
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+if _NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _idw_kernel(distances, neighbors, values, out):
+        """
+        Inverse-distance-weighted (p=1) interpolation over the k nearest neighbors.
+
+        :param distances: Array of shape (cells, k) with neighbor distances.
+        :param neighbors: Array of shape (cells, k) with neighbor indices into values.
+        :param values: Array of sample values.
+        :param out: Output array of shape (cells,) to fill.
+        """
+        epsilon = 1e-12
+        for i in prange(distances.shape[0]):
+            numerator = 0.0
+            denominator = 0.0
+            exact_hit = False
+            for j in range(distances.shape[1]):
+                distance = distances[i, j]
+                if distance < epsilon:
+                    # Grid cell coincides with a sample, use its value directly
+                    out[i] = values[neighbors[i, j]]
+                    exact_hit = True
+                    break
+                weight = 1.0 / distance
+                numerator += weight * values[neighbors[i, j]]
+                denominator += weight
+            if not exact_hit:
+                out[i] = numerator / denominator
+
+
+def _idw_interpolate(distances, neighbors, values):
+    """
+    Interpolate sample values onto query points via inverse distance weighting.
+
+    :param distances: Array of shape (cells, k) with neighbor distances.
+    :param neighbors: Array of shape (cells, k) with neighbor indices into values.
+    :param values: Array of sample values.
+    :return: Array of shape (cells,) with interpolated values.
+    """
+    if _NUMBA_AVAILABLE:
+        out = np.empty(distances.shape[0], dtype=np.float64)
+        _idw_kernel(distances, neighbors, values, out)
+        return out
+
+    # NumPy fallback when numba is not installed
+    epsilon = 1e-12
+    weights = 1.0 / np.maximum(distances, epsilon)
+    interpolated = (values[neighbors] * weights).sum(axis=1) / weights.sum(axis=1)
+    exact_hits = distances[:, 0] < epsilon
+    interpolated[exact_hits] = values[neighbors[exact_hits, 0]]
+    return interpolated
+
 
 class MethaneData:
     def __init__(self, position_data, methane_column = 'GAS:Methane', status_column = 'GAS:Status'):
@@ -18,6 +76,9 @@ class MethaneData:
         self.status_column = status_column
         self.NO_DATA_MAX_LEVEL = 10
         self.NO_DATA_VALUE = -9999
+        # KD-trees reused across repeated map_methane calls, keyed by the
+        # filter/projection settings that determine the sample coordinates
+        self._kdtree_cache = {}
 
     def map_methane(self, map_path, area_epsg, grid_rows=100, grid_columns=100, environment_methane_perc=95, ignore_invalid=True):
         """
@@ -47,48 +108,64 @@ class MethaneData:
 
         # Calculate methane threshold
         threshold = np.percentile(df[self.methane_column], environment_methane_perc)
-        print("Methane Threshold: ", threshold)
-        df['adjusted_methane'] = df[self.methane_column] - threshold
-        df['adjusted_methane'] = df['adjusted_methane'].clip(lower=0)
+        # Subtract the environment level and clip in place on one float32 buffer
+        adjusted = df[self.methane_column].to_numpy(dtype=np.float32, copy=True)
+        np.subtract(adjusted, np.float32(threshold), out=adjusted)
+        np.maximum(adjusted, 0, out=adjusted)
+        df['adjusted_methane'] = adjusted
 
-        # Check and handle CRS
+        # Reproject only when the data is not already in the target CRS
         original_crs = self.position_data.data.crs
-        if original_crs.is_geographic:
+        if original_crs.to_epsg() != int(area_epsg):
             df = df.to_crs(epsg=area_epsg)
 
         # Extract x and y coordinates
-        df['x'] = df['geometry'].x
-        df['y'] = df['geometry'].y
-
-        # Coordinates and values for interpolation
-        x, y = df.geometry.x, df.geometry.y
-        z = df['adjusted_methane']
+        # Extract coordinates and values once into contiguous arrays
+        x = df.geometry.x.to_numpy()
+        y = df.geometry.y.to_numpy()
+        z = df['adjusted_methane'].to_numpy(dtype=np.float64)
 
-        # Assuming x, y, z are your data arrays or columns in a DataFrame
+        # Drop samples with incomplete coordinates or readings
         mask = ~np.isnan(x) & ~np.isnan(y) & ~np.isnan(z)
-        x_clean = x[mask]
-        y_clean = y[mask]
-        z_clean = z[mask]
-        x = x_clean
-        y = y_clean
-        z = z_clean
+        x = x[mask]
+        y = y[mask]
+        z = z[mask]
 
         # Create a grid
         xi = np.linspace(x.min(), x.max(), grid_columns)
         yi = np.linspace(y.min(), y.max(), grid_rows)
-        X, Y = np.meshgrid(xi, yi)
-
-        # Interpolate z values on the grid
-        Z = griddata((x, y), z, (X, Y), method='cubic').astype('float32')
+        # Sparse axes avoid materializing two full grid-sized coordinate arrays
+        X, Y = np.meshgrid(xi, yi, sparse=True, indexing='xy')
+        query_points = np.stack(np.broadcast_arrays(X, Y), axis=-1).reshape(-1, 2)
+
+        # Interpolate z values on the grid via inverse distance weighting over
+        # the k nearest samples; the KD-tree query runs on all cores. The tree
+        # only depends on the sample coordinates, so batch runs that sweep the
+        # threshold or grid size reuse it instead of rebuilding
+        cache_key = (ignore_invalid, int(area_epsg))
+        tree = self._kdtree_cache.get(cache_key)
+        if tree is None or tree.n != len(x):
+            tree = cKDTree(np.column_stack([x, y]))
+            self._kdtree_cache[cache_key] = tree
+        k = min(16, len(x))
+        distances, neighbors = tree.query(query_points, k=k, workers=-1)
+        if k == 1:
+            distances = distances[:, np.newaxis]
+            neighbors = neighbors[:, np.newaxis]
+        Z = _idw_interpolate(distances, neighbors, z)
+        Z = Z.reshape(grid_rows, grid_columns).astype('float32')
 
         # build geo transform
         xsize = (xi.max() - xi.min()) / Z.shape[1]
         ysize = (yi.min() - yi.max()) / Z.shape[0]  # Negative value
         transform = from_origin(xi.min(), yi.min(), xsize, ysize)
 
-        # Before writing, replace NaNs (or other values) with the NO_DATA value
-        Z_filled = np.where(np.logical_or(np.isnan(Z), Z < self.NO_DATA_MAX_LEVEL), self.NO_DATA_VALUE, Z)
-
+        # Before writing, replace NaNs (or other values) with the NO_DATA value,
+        # filling in place to avoid allocating another grid-sized array
+        no_data_mask = np.isnan(Z)
+        np.less(Z, self.NO_DATA_MAX_LEVEL, out=no_data_mask, where=~no_data_mask)
+        Z[no_data_mask] = self.NO_DATA_VALUE
+        Z_filled = Z
 
         with rasterio.open(
             map_path,  # Output filename
@@ -100,6 +177,12 @@ class MethaneData:
             dtype=Z_filled.dtype,
             crs=df.crs,
             transform=transform,
-            nodata=self.NO_DATA_VALUE  # Specify the NO_DATA value here
+            nodata=self.NO_DATA_VALUE,  # Specify the NO_DATA value here
+            tiled=True,
+            blockxsize=256,
+            blockysize=256,
+            compress='DEFLATE',
+            predictor=3,  # Floating-point predictor
+            num_threads='ALL_CPUS'
         ) as dst:
             dst.write(Z_filled, 1)
\ No newline at end of file
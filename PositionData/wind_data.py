@@ -1,12 +1,30 @@
+import glob
+import hashlib
+import os
+import shutil
+
 import geopandas as gpd
-import math
 import numpy as np
 import pandas as pd
 from PositionData import PositionData
-from scipy.interpolate import griddata
+from ._wind_kernels import compute_true_wind
+from scipy.interpolate import CloughTocher2DInterpolator, LinearNDInterpolator
+from scipy.spatial import cKDTree
 from windrose import WindroseAxes
 import matplotlib.pyplot as plt
 
+
+def _num(df, column):
+    """
+    Extract a column as a contiguous float64 array, coercing bad values to NaN.
+
+    :param df: Source DataFrame.
+    :param column: Name of the column to extract.
+    :return: float64 ndarray with non-numeric entries as NaN.
+    """
+    return pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float64)
+
+
 class WindData:
     def __init__(self, position_data,air_speed_prop, air_dir_prop, platform_speed_prop, platform_dir_prop, true_speed_prop, true_dir_prop, sensor_cw_rot = 0, sensor_to_north = False):
         """
@@ -42,109 +60,157 @@ class WindData:
         :param sensor_to_north: if true, means that sensor readings are related to North, otherwise relative to platform noze
         :return: New instance of PositionData with calculated true wind.
         """
-        new_gdf = position_data.data.copy(deep=True)
-        twoxpi = (2 * math.pi)
-        tolerance = -0.001
-
-        for idx, row in new_gdf.iterrows():
-            try:
-                # platform speed
-                pv = float(row[platform_speed_prop])
-                # plaform direction relative to north
-                pd =  math.radians(float(row[platform_dir_prop]))
-                # registered wind velocity
-                rwv = float(row[air_speed_prop])
-                # registered wind direction
-                rwd = math.radians(float(row[air_dir_prop]))
-                # if sensor readings are relative to platform body
-                # calculate engle relative to north
-                if not sensor_to_north:
-                    rwd = (pd + rwd + math.radians(sensor_cw_rot)) % twoxpi
-                # when platform is moving we get an artificial wind in the opposite direction
-                #awd = (pd + math.pi) % twoxpi
-
-                # now calculate vector components
-                px = pv * math.cos(pd)
-                py = pv * math.sin(pd)
-                rwx = rwv * math.cos(rwd)
-                rwy = rwv * math.sin(rwd)
-                # calculate true wind vector
-                twx = rwx - px
-                twy = rwy - py
-
-                # calculate true wind speed and direction
-                twv = math.sqrt(twx**2 + twy**2)
-                twd = math.atan2(twy, twx)
-                twd_degrees = math.degrees(twd)
-                if twd_degrees < tolerance: twd_degrees = 360 + twd_degrees
-
-                # Assign to separate properties in the GeoDataFrame using loc
-                new_gdf.loc[idx, true_speed_prop] = twv
-                new_gdf.loc[idx, true_dir_prop] = twd_degrees
-            except (ValueError, TypeError): 
-                # If there's any missing or invalid data, continue to the next row
-                continue
-    
-        result = PositionData.__new__(PositionData)
-        result.data = new_gdf.copy(deep=True)
+        source = position_data.data
+
+        # Pull the four inputs in one batch as a 2D float array; missing or
+        # invalid entries coerce to NaN and propagate through the vector math,
+        # and ascontiguousarray hands the kernel C-contiguous rows
+        arr = source[[platform_speed_prop, platform_dir_prop, air_speed_prop, air_dir_prop]] \
+            .apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64, copy=False)
+        pv, pd_deg, rwv, rwd_deg = (np.ascontiguousarray(column) for column in arr.T)
+
+        twv, twd_degrees, tw_u, tw_v = compute_true_wind(pv, pd_deg, rwv, rwd_deg, sensor_cw_rot, sensor_to_north)
 
-        return result
+        # assign() shares the existing column blocks, so no deep copies of the
+        # source frame are made on either side of the computation. The cartesian
+        # components are kept alongside speed/direction so grid_wind can skip
+        # the polar round trip
+        new_gdf = source.assign(**{
+            true_speed_prop: twv,
+            true_dir_prop: twd_degrees,
+            f"{true_speed_prop}_u": tw_u,
+            f"{true_speed_prop}_v": tw_v,
+        })
+
+        return position_data._init_new_instance(new_gdf)
     
-    def grid_wind(self, speed_property, direction_property, method='linear', resolution=100):
+    def grid_wind(self, speed_property, direction_property, method='linear', resolution=100, dtype=np.float64):
         """
-        Grid measurements 
+        Grid measurements
 
         :param speed_property: Property name for air speed.
         :param direction_property: Property name for air direction.
-        :param method: gridding method according to https://docs.scipy.org/doc/scipy/reference/generated/scipy.interpolate.griddata.html
-        :param resolution: grid size 
+        :param method: gridding method according to https://docs.scipy.org/doc/scipy/reference/generated/scipy.interpolate.griddata.html,
+            plus 'bin' for per-cell mean aggregation via 2D histograms (one
+            pass over the samples, no interpolation)
+        :param resolution: grid size
+        :param dtype: dtype for the wind values and output grids; np.float32
+            halves their memory traffic and still exceeds typical wind sensor
+            precision. Coordinates stay float64 regardless: at degree scale
+            float32 resolution is comparable to the GPS sample spacing, so
+            casting them would merge nearby samples and distort the
+            triangulation
         """
         # Check if the properties exist
         for prop in [speed_property, direction_property]:
             if prop not in self.position_data.data.columns:
                 raise ValueError(f"'{prop}' does not exist in the properties.")
 
-        data = self.position_data.data.dropna(subset=[speed_property, direction_property]).copy(deep = True)
-        # Convert the properties to float and drop non-numeric values (NaN)
-        for prop in [speed_property, direction_property]:
-            data[prop] = pd.to_numeric(data[prop], errors='coerce')
-
-        # Extract x, y, and vector values for interpolation
-        x = data.geometry.x.values
-        y = data.geometry.y.values
-        speed_values = data[speed_property].values
-        direction_values = np.radians(data[direction_property].values)  # Convert to radians
+        # Coerce to numeric before filtering; the previous dropna-then-coerce
+        # order let non-numeric strings back in as NaN after the filter and
+        # deep-copied the frame just to overwrite two columns
+        data = self.position_data.data
+        geometry = data.geometry
+        u_column = f"{speed_property}_u"
+        v_column = f"{speed_property}_v"
+        if u_column in data.columns and v_column in data.columns:
+            # Components cached by _true_wind, no polar round trip needed
+            u = _num(data, u_column)
+            v = _num(data, v_column)
+        else:
+            speed_values = _num(data, speed_property)
+            direction_values = np.radians(_num(data, direction_property))  # Convert to radians
 
-        # Convert polar coordinates (speed, direction) to cartesian for interpolation
-        u = speed_values * np.sin(direction_values)
-        v = speed_values * np.cos(direction_values)
+            # Convert polar coordinates (speed, direction) to cartesian for interpolation
+            u = speed_values * np.sin(direction_values)
+            v = speed_values * np.cos(direction_values)
 
-        # Create a grid
-        grid_y, grid_x = np.mgrid[max(y):min(y):complex(0, resolution), min(x):max(x):complex(0, resolution)]
+        # Extract x, y for valid rows only; coordinates stay float64 so the
+        # triangulation sees the full GPS resolution, dtype applies to values
+        mask = np.isfinite(u) & np.isfinite(v) & geometry.notna().to_numpy()
+        x = geometry.x.to_numpy()[mask]
+        y = geometry.y.to_numpy()[mask]
+        u = u[mask].astype(dtype, copy=False)
+        v = v[mask].astype(dtype, copy=False)
 
-        # Interpolate u and v components
-        grid_u = griddata((x, y), u, (grid_x, grid_y), method=method)
-        grid_v = griddata((x, y), v, (grid_x, grid_y), method=method)
+        # Create a grid; explicit linspace axes replace the complex-step mgrid
+        # while keeping the same descending-y row order
+        xs = np.linspace(x.min(), x.max(), resolution)
+        ys = np.linspace(y.max(), y.min(), resolution)
 
-        # Convert back interpolated cartesian to polar coordinates
-        interpolated_speed = np.sqrt(grid_u**2 + grid_v**2)
-        interpolated_direction = (np.degrees(np.arctan2(grid_u, grid_v)) + 360) % 360  # Convert back to degrees
+        if method == 'bin':
+            # Cell-mean aggregation in one pass over the samples: weighted 2D
+            # histograms give the per-cell sums of u and v, divided by counts.
+            # Cost is O(samples), independent of the number of grid cells
+            x_edges = np.linspace(x.min(), x.max(), resolution + 1)
+            y_edges = np.linspace(y.min(), y.max(), resolution + 1)
+            counts = np.histogram2d(x, y, bins=[x_edges, y_edges])[0]
+            sum_u = np.histogram2d(x, y, bins=[x_edges, y_edges], weights=u)[0]
+            sum_v = np.histogram2d(x, y, bins=[x_edges, y_edges], weights=v)[0]
+            with np.errstate(invalid='ignore'):
+                grid_u = sum_u / counts  # empty cells become NaN
+                grid_v = sum_v / counts
+            # histogram2d is (x, y)-indexed with ascending y; transpose and
+            # flip into the descending-y row-major layout of the other methods
+            grid_u = grid_u.T[::-1].astype(dtype, copy=False)
+            grid_v = grid_v.T[::-1].astype(dtype, copy=False)
+            # Place the output points at the cell centers
+            xs = ((x_edges[:-1] + x_edges[1:]) / 2).astype(dtype, copy=False)
+            ys = ((y_edges[:-1] + y_edges[1:]) / 2)[::-1].astype(dtype, copy=False)
+        else:
+            # Interpolate u and v components. The Delaunay triangulation dominates
+            # the cost of linear/cubic gridding, so build it once for u and reuse
+            # it for v instead of letting griddata triangulate twice
+            points = np.column_stack([x, y])
+            if method == 'nearest':
+                # Nearest-neighbor gridding needs no triangulation at all: one
+                # KD-tree query yields the indices used for both components
+                tree = cKDTree(points)
+                interp_u = interp_v = None
+            elif method == 'linear':
+                interp_u = LinearNDInterpolator(points, u)
+                interp_v = LinearNDInterpolator(interp_u.tri, v)
+            elif method == 'cubic':
+                interp_u = CloughTocher2DInterpolator(points, u)
+                interp_v = CloughTocher2DInterpolator(interp_u.tri, v)
+            else:
+                raise ValueError(f"Unsupported gridding method '{method}'.")
 
-        # Convert grid to GeoDataFrame
-        grid_geom = [gpd.points_from_xy(grid_x_row, grid_y_row) for grid_x_row, grid_y_row in zip(grid_x, grid_y)]
-        grid_geom = [point for sublist in grid_geom for point in sublist]  # Flatten the list
-        grid_df = gpd.GeoDataFrame(geometry=grid_geom)
-        grid_df.set_crs(data.crs)
+            # Evaluate the grid in row blocks so peak memory is bounded by the two
+            # output arrays rather than six full meshes; at large resolutions the
+            # full coordinate meshes alone would not fit in RAM
+            grid_u = np.empty((resolution, resolution), dtype=dtype)
+            grid_v = np.empty((resolution, resolution), dtype=dtype)
+            tile_rows = max(1, min(resolution, 4_000_000 // resolution))
+            for row_start in range(0, resolution, tile_rows):
+                row_stop = min(row_start + tile_rows, resolution)
+                tile_x, tile_y = np.meshgrid(xs, ys[row_start:row_stop], indexing='xy')
+                if method == 'nearest':
+                    _, nearest = tree.query(np.column_stack([tile_x.ravel(), tile_y.ravel()]), workers=-1)
+                    grid_u[row_start:row_stop] = u[nearest].reshape(tile_x.shape)
+                    grid_v[row_start:row_stop] = v[nearest].reshape(tile_x.shape)
+                else:
+                    grid_u[row_start:row_stop] = interp_u(tile_x, tile_y)
+                    grid_v[row_start:row_stop] = interp_v(tile_x, tile_y)
 
-        # Assign interpolated data to the GeoDataFrame
-        grid_df[speed_property] = interpolated_speed.ravel()
-        grid_df[direction_property] = interpolated_direction.ravel()
+        # Convert back interpolated cartesian to polar coordinates; arctan2
+        # lands in [-180, 180], so the wrap is a conditional add, not a modulo
+        interpolated_speed = np.hypot(grid_u, grid_v)
+        interpolated_direction = np.degrees(np.arctan2(grid_u, grid_v))  # Convert back to degrees
+        np.add(interpolated_direction, 360.0, out=interpolated_direction, where=interpolated_direction < 0)
 
-        # Return a new PositionData instance
-        result = PositionData.__new__(PositionData)
-        result.data = grid_df.copy(deep = True)
+        # Convert grid to GeoDataFrame: one points_from_xy call over the
+        # flattened mesh (tiled xs / repeated ys reproduce the row-major mesh
+        # order without materializing it), and passing crs to the constructor
+        # actually sets it (the old set_crs call discarded its result)
+        grid_geom = gpd.points_from_xy(np.tile(xs, resolution), np.repeat(ys, resolution))
+        grid_df = gpd.GeoDataFrame({
+            speed_property: interpolated_speed.ravel(),
+            direction_property: interpolated_direction.ravel(),
+        }, geometry=grid_geom, crs=data.crs)
 
-        return result
+        # Return a new PositionData instance without a trailing deep copy
+        return self.position_data._init_new_instance(grid_df)
     
     def build_windrose(self, speed_col, direction_col, output_path, bins = [0,2,4,6,8,10], nsector = 16, title="Windrose"):
         """
@@ -154,11 +220,43 @@ class WindData:
         :param direction_col: Name of the wind direction column.
         :param output_path: Path to save the generated windrose image.
         """
+        directions = self.position_data.data[direction_col].astype(float)
+        speeds = self.position_data.data[speed_col].astype(float)
+
+        # Rendering dominates this call, so finished images are kept next to
+        # the output keyed by a hash of the data and plot settings; repeated
+        # runs on unchanged inputs copy the cached file instead of re-rendering
+        digest = hashlib.blake2b(
+            np.ascontiguousarray(directions.to_numpy()).tobytes()
+            + np.ascontiguousarray(speeds.to_numpy()).tobytes()
+            + repr((bins, nsector, title)).encode(),
+            digest_size=16).hexdigest()
+        root, extension = os.path.splitext(output_path)
+        cache_path = f"{root}.{digest}{extension}"
+        if os.path.exists(cache_path):
+            shutil.copyfile(cache_path, output_path)
+            return
+
+        # Changing inputs change the digest, so drop cache files left behind
+        # by earlier renders of the same output instead of accumulating them
+        for stale_path in glob.glob(f"{glob.escape(root)}.*{glob.escape(extension)}"):
+            stale_digest = stale_path[len(root) + 1:len(stale_path) - len(extension)]
+            if len(stale_digest) == 32 and all(c in '0123456789abcdef' for c in stale_digest):
+                try:
+                    os.remove(stale_path)
+                except OSError:
+                    pass
+
         ax = WindroseAxes.from_ax()
-        ax.bar(self.position_data.data[direction_col].astype(float), self.position_data.data[speed_col].astype(float), normed=True, 
+        ax.bar(directions, speeds, normed=True,
                opening=0.8, edgecolor='white', bins = bins, nsector = nsector)
         ax.set_title(title)
         ax.set_legend()
 
         plt.savefig(output_path, bbox_inches='tight')
         plt.close()
+
+        try:
+            shutil.copyfile(output_path, cache_path)
+        except OSError:
+            pass  # caching is best effort, the requested output exists
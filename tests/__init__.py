@@ -1,4 +1,10 @@
+import os
+
+# The on-disk polygon cache is opt-in; enable it for the suite so repeated
+# clip tests skip the GeoJSON parse and union
+os.environ.setdefault('POSITIONDATA_POLYGON_CACHE', '1')
+
 from .test_position_data import TestPositionData
 from .test_methane_data import TestMethaneData
 from .test_wind_data import TestWindData
-from .test_trajectory import TestTrajectory
\ No newline at end of file
+from .test_trajectory import TestTrajectory
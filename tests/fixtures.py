@@ -0,0 +1,33 @@
+from PositionData.position_data import PositionData
+
+# PositionData operations never mutate the instance they are called on, so
+# fixtures loaded from the same file can be shared safely between test
+# classes instead of re-parsing the CSV and re-clipping in every setUpClass.
+_position_data = {}
+_clipped = {}
+
+
+def cached_position_data(path):
+    """
+    Return a memoized PositionData loaded from path.
+
+    :param path: Path to the source CSV/GeoJSON file.
+    :return: Shared PositionData instance.
+    """
+    if path not in _position_data:
+        _position_data[path] = PositionData(path)
+    return _position_data[path]
+
+
+def cached_clip(path, polygon_path):
+    """
+    Return a memoized PositionData loaded from path and clipped by a polygon.
+
+    :param path: Path to the source CSV/GeoJSON file.
+    :param polygon_path: Path to the clip polygon GeoJSON file.
+    :return: Shared clipped PositionData instance.
+    """
+    key = (path, polygon_path)
+    if key not in _clipped:
+        _clipped[key] = cached_position_data(path).clip_by_polygon(polygon_path)
+    return _clipped[key]
@@ -2,17 +2,18 @@ import shutil
 import tempfile
 import unittest
 import os
-from PositionData.position_data import PositionData  # Import your PositionData class
 from PositionData.methane_data import MethaneData  # Import your MethaneData class
+from tests.fixtures import cached_clip, cached_position_data
 
 class TestMethaneData(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         # Load PositionData from a CSV file
-        cls.position_data = PositionData("tests/data/methane/2023-12-07-flight1.csv")
+        cls.position_data = cached_position_data("tests/data/methane/2023-12-07-flight1.csv")
 
         # Clip by a GeoJSON polygon (adjust the path to your GeoJSON file)
-        cls.clipped_position_data = cls.position_data.clip_by_polygon("tests/data/methane/area-2023-12-07-flight1.geojson")
+        cls.clipped_position_data = cached_clip("tests/data/methane/2023-12-07-flight1.csv",
+                                                "tests/data/methane/area-2023-12-07-flight1.geojson")
 
         # create temp dir
         cls.temp_dir = tempfile.mkdtemp() 
@@ -2,30 +2,34 @@ import os
 import shutil
 import tempfile
 import unittest
-from PositionData.position_data import PositionData  
+import numpy as np
+import pandas as pd
+from PositionData.position_data import PositionData
+from tests.fixtures import cached_clip, cached_position_data
 
 class TestPositionData(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
         # Initialize with a sample methane dataset
-        cls.falcon1_data = PositionData('tests/data/methane/falcon1.csv')
+        cls.falcon1_data = cached_position_data('tests/data/methane/falcon1.csv')
         cls.falcon1_rows = 28
         cls.falcon1_columns = 21
         cls.falcon1_rows_nan = 3
         cls.falcon1_column_w_nan = "GAS:Methane"
 
         # Initialize with a sample wind data
-        cls.wind1_data = PositionData('tests/data/wind/wind-trajectory1.csv')
+        cls.wind1_data = cached_position_data('tests/data/wind/wind-trajectory1.csv')
         cls.wind1_clipped_rows = 5156
         cls.wind1_clipped_columns = 19
         cls.wind1_polygon_path = 'tests/data/wind/big-area.json'
         cls.wind1_platform_direction_column = "Direction"
 
         # Load PositionData from a CSV file
-        cls.falcon2_data = PositionData("tests/data/methane/2023-12-07-flight2.csv")
+        cls.falcon2_data = cached_position_data("tests/data/methane/2023-12-07-flight2.csv")
         # Clip by a GeoJSON polygon (adjust the path to your GeoJSON file)
-        cls.clipped_falcon2_data = cls.falcon2_data.clip_by_polygon("tests/data/methane/area-2023-12-07-flight2.geojson")
+        cls.clipped_falcon2_data = cached_clip("tests/data/methane/2023-12-07-flight2.csv",
+                                               "tests/data/methane/area-2023-12-07-flight2.geojson")
         cls.falcon2_column_methane = "GAS:Methane"
         cls.falcon2_methane_min = 350
         cls.falcon2_methane_max = 500
@@ -57,9 +61,9 @@ class TestPositionData(unittest.TestCase):
         shape = clipped.shape()
         self.assertEqual(shape, (self.wind1_clipped_rows, self.wind1_clipped_columns)) 
 
-    # Test direction 
+    # Test direction
     def test_calculate_direction(self):
-        clipped = self.wind1_data.clip_by_polygon(self.wind1_polygon_path)
+        clipped = cached_clip('tests/data/wind/wind-trajectory1.csv', self.wind1_polygon_path)
         direction = clipped.calculate_direction(self.wind1_platform_direction_column)
         self.assertTrue(self.wind1_platform_direction_column in direction.data.columns)
 
@@ -68,6 +72,61 @@ class TestPositionData(unittest.TestCase):
         filtered = self.clipped_falcon2_data.filter_range(self.falcon2_column_methane, self.falcon2_methane_min, self.falcon2_methane_max)
         self.assertEqual(filtered.shape()[0], self.falcon2_filtered_rows)
 
+    # Test noise filtering against the pandas rolling reference, including NaNs
+    def test_filter_noize(self):
+        window_size = 3
+        values = pd.to_numeric(self.falcon1_data.data[self.falcon1_column_w_nan], errors='coerce')
+        for filter_type, reference in (('average', 'mean'), ('median', 'median')):
+            filtered = self.falcon1_data.filter_noize(self.falcon1_column_w_nan, filter_type, window_size)
+            expected = getattr(values.rolling(window=window_size, min_periods=1), reference)()
+            np.testing.assert_allclose(filtered.data[self.falcon1_column_w_nan].to_numpy(),
+                                       expected.to_numpy(), rtol=1e-12)
+
+    # Test that the batch filter matches per-column filter_noize
+    def test_filter_noize_many(self):
+        columns = [self.falcon1_column_w_nan, 'Velocity']
+        for filter_type in ('average', 'median'):
+            batch = self.falcon1_data.filter_noize_many(columns, filter_type, 3)
+            for column in columns:
+                single = self.falcon1_data.filter_noize(column, filter_type, 3)
+                np.testing.assert_allclose(batch.data[column].to_numpy(),
+                                           single.data[column].to_numpy(), rtol=1e-12)
+
+    # A constant column must bin like np.histogram: the degenerate range is
+    # padded by half a unit on each side, landing all mass in the middle bin
+    def test_statistics_constant_column(self):
+        csv_path = os.path.join(self.temp_dir, 'constant.csv')
+        with open(csv_path, 'w') as csv_file:
+            csv_file.write("Latitude,Longitude,Value\n")
+            for row in range(5):
+                csv_file.write(f"{row},{row},7.5\n")
+        stats = PositionData(csv_path).statistics('Value', bins=4)
+        self.assertEqual(stats['minimum'], stats['maximum'])
+        self.assertEqual(stats['probability_distribution'], [0.0, 0.0, 1.0, 0.0])
+
+    # Test that repeated string columns are dictionary-encoded on load while
+    # high-cardinality text is left alone
+    def test_category_encoding(self):
+        dtypes = self.falcon1_data.data.dtypes
+        self.assertIsInstance(dtypes['Status RTK'], pd.CategoricalDtype)
+        self.assertIsInstance(dtypes['Date'], pd.CategoricalDtype)
+        # Every timestamp is unique, so 'Time' must stay a plain string column
+        self.assertNotIsInstance(dtypes['Time'], pd.CategoricalDtype)
+
+    # Test streaming clipped load against whole-file load followed by clip
+    def test_from_csv_clipped(self):
+        streamed = PositionData.from_csv_clipped('tests/data/wind/wind-trajectory1.csv', self.wind1_polygon_path)
+        clipped = cached_clip('tests/data/wind/wind-trajectory1.csv', self.wind1_polygon_path)
+        self.assertEqual(streamed.shape(), (self.wind1_clipped_rows, self.wind1_clipped_columns))
+        # Row numbering must line up with the whole-file load
+        self.assertTrue((streamed.data.index == clipped.data.index).all())
+        # Values must match; dictionary encoding may differ because the
+        # streamed path derives the categories from the clipped rows only
+        pd.testing.assert_frame_equal(streamed.data.drop(columns='geometry'),
+                                      clipped.data.drop(columns='geometry'),
+                                      check_dtype=False, check_categorical=False)
+        self.assertTrue(streamed.data.geometry.equals(clipped.data.geometry))
+
     # Test export as csv
     def test_export_as_csv(self):
         self.falcon1_data.export_as_csv(self.csv_path)
@@ -1,29 +1,37 @@
 import unittest
-from PositionData import PositionData
 from PositionData import Trajectory
+from tests.fixtures import cached_position_data
 import tempfile
 import os
 import shutil
 
+# One temp directory per module instead of per TestCase, torn down once
+_temp_dir = None
+
+def setUpModule():
+    global _temp_dir
+    _temp_dir = tempfile.mkdtemp()
+    print("Trajectory temp: ", _temp_dir)
+
+def tearDownModule():
+    if _temp_dir and os.path.exists(_temp_dir):
+        shutil.rmtree(_temp_dir)
+
 class TestTrajectory(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
         # Create a mock PositionData instance
         # Assuming the PositionData class can be initialized with a CSV file path
-        cls.position_data = PositionData('tests/data/methane/2023-12-07-flight1.csv').clean_nan(['Latitude', 'Longitude'])
+        cls.position_data = cached_position_data('tests/data/methane/2023-12-07-flight1.csv').clean_nan(['Latitude', 'Longitude'])
 
         # Clip trajectory
         # Clip by a GeoJSON polygon (adjust the path to your GeoJSON file)
         cls.clipped_falcon1_data = cls.position_data.clip_by_polygon("tests/data/methane/area-2023-12-07-flight1.geojson")
 
-        # Create temp dir
-        cls.temp_dir = tempfile.mkdtemp()
-        cls.trajectory_path = os.path.join(cls.temp_dir, 'flight1-traj.json')
-        cls.trajectory_path_clipped = os.path.join(cls.temp_dir, 'flight1-traj-clipped.json')
-        cls.clean_temp = True  # Set to True to clean up temp directory after tests
-
-        print("Trajectory temp: ", cls.temp_dir)
+        # Export targets inside the module-scoped temp dir
+        cls.trajectory_path = os.path.join(_temp_dir, 'flight1-traj.json')
+        cls.trajectory_path_clipped = os.path.join(_temp_dir, 'flight1-traj-clipped.json')
 
     def test_initialization(self):
         trajectory = Trajectory(self.position_data, 'Date', 'Time', 2, 'EPSG:32635')
@@ -47,20 +55,15 @@ class TestTrajectory(unittest.TestCase):
     def test_export_to_geojson(self):
         trajectory = Trajectory(self.position_data, 'Date', 'Time', 2, 'EPSG:32635')
         gdf, _ = trajectory.polyline()
-        gdf.to_file(self.trajectory_path, driver='GeoJSON')
+        gdf.to_file(self.trajectory_path, driver='GeoJSON', engine='pyogrio')
         self.assertTrue(os.path.exists(self.trajectory_path))
 
     def test_export_to_geojson_clipped(self):
         trajectory = Trajectory(self.clipped_falcon1_data, 'Date', 'Time', 2, 'EPSG:32635')
         gdf, _ = trajectory.polyline()
-        gdf.to_file(self.trajectory_path_clipped, driver='GeoJSON')
+        gdf.to_file(self.trajectory_path_clipped, driver='GeoJSON', engine='pyogrio')
         self.assertTrue(os.path.exists(self.trajectory_path_clipped))
 
-    @classmethod
-    def tearDownClass(cls):
-        # Remove the temporary directory
-        if os.path.exists(cls.temp_dir) and cls.clean_temp:
-            shutil.rmtree(cls.temp_dir)
 
 if __name__ == '__main__':
     unittest.main()